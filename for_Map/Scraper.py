@@ -12,6 +12,24 @@ import random
 import os
 from pathlib import Path
 import subprocess
+from field_classifier import FieldClassifier
+
+classifier = FieldClassifier({
+    'address': [
+        'street', 'road', 'avenue', 'temple', 'colony', 'nagar', 'maharashtra',
+        'delhi', 'backside', 'behind', 'opposite', 'above', 'floor'
+    ]
+})
+
+def element_texts(elements):
+    """Read the text of each element, skipping ones that went stale"""
+    texts = []
+    for elem in elements:
+        try:
+            texts.append(elem.text.strip())
+        except StaleElementReferenceException:
+            continue
+    return texts
 
 def extract_cafe_details(driver):
     """Extract name, address, and phone from the details panel with direct extraction"""
@@ -50,44 +68,22 @@ def extract_cafe_details(driver):
             print("Looking for address and phone elements...")
             info_divs = driver.find_elements(By.CSS_SELECTOR, "div.Io6YTe.fontBodyMedium.kR99db.fdkmkc")
             
-            for div in info_divs:
-                try:
-                    text = div.text.strip()
-                    if not text:
-                        continue
-                        
-                
-                    digits = ''.join(filter(str.isdigit, text))
-                    if len(digits) >= 10 and len(digits) / len(text) > 0.5:
-                        if cafe_details['phone'] == 'N/A':
-                            cafe_details['phone'] = text
-                            print(f"Successfully extracted phone: {text}")
-                    
-                  
-                    elif any(indicator in text.lower() for indicator in [
-                        'street', 'road', 'avenue', 'temple', 'colony', 'nagar', 'maharashtra', 
-                        'delhi', 'backside', 'behind', 'opposite', 'above', 'floor'
-                    ]):
-                        if cafe_details['address'] == 'N/A':
-                            cafe_details['address'] = text
-                            print(f"Successfully extracted address: {text}")
-                except StaleElementReferenceException:
-                    continue
+            best = classifier.classify(element_texts(info_divs), fields=('phone', 'address'))
+            
+            if best['phone']:
+                cafe_details['phone'] = best['phone'].value
+                print(f"Successfully extracted phone: {best['phone'].value}")
+            
+            if best['address']:
+                cafe_details['address'] = best['address'].text
+                print(f"Successfully extracted address: {best['address'].text}")
         
             if cafe_details['address'] == 'N/A':
                 address_elements = driver.find_elements(By.CSS_SELECTOR, "div.Io6YTe.fontBodyMedium")
-                for elem in address_elements:
-                    try:
-                        text = elem.text.strip()
-                        if any(indicator in text.lower() for indicator in [
-                            'street', 'road', 'avenue', 'temple', 'colony', 'nagar', 'maharashtra', 
-                            'delhi', 'backside', 'behind', 'opposite', 'above', 'floor'
-                        ]):
-                            cafe_details['address'] = text
-                            print(f"Extracted address from fallback: {text}")
-                            break
-                    except StaleElementReferenceException:
-                        continue
+                best = classifier.classify(element_texts(address_elements), fields=('address',))
+                if best['address']:
+                    cafe_details['address'] = best['address'].text
+                    print(f"Extracted address from fallback: {best['address'].text}")
        
             if cafe_details['phone'] == 'N/A':
             
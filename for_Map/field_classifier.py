@@ -0,0 +1,209 @@
+import re
+from collections import namedtuple
+
+# Best match for one field: the original text node, the cleaned value and a 0..1 confidence
+Candidate = namedtuple('Candidate', ['text', 'value', 'confidence'])
+
+FIELDS = ('name', 'phone', 'address')
+KEYWORD_FIELDS = ('name', 'address')
+
+# A run of digits, spaces, dashes and brackets; may hold several numbers, see _phone_digits
+PHONE_PATTERN = r'\+?\(?\d[\d \-()]{8,}\d'
+
+
+def _national_number(digits):
+    """Reduce 10-12 digits to the 10 digit national number, or None if it isn't one.
+
+    "919876543210" (+91 country code) and "07314001234" (0 trunk prefix) both
+    lose their prefix, so the same phone always comes out in the same form.
+    """
+    if len(digits) == 12 and digits.startswith('91'):
+        digits = digits[2:]
+    elif len(digits) == 11 and digits.startswith('0'):
+        digits = digits[1:]
+    if len(digits) == 10 and not digits.startswith('0'):
+        return digits
+    return None
+
+
+def _phone_digits(run):
+    """Return the 10 digit national number of the first phone in a run, or None.
+
+    The run is split on spaces and consecutive pieces are joined from the left,
+    keeping the longest join that is a valid number. Pieces under 3 digits are
+    only allowed as a leading country code, and a 6 digit pincode never starts
+    a join, so "452001 0731 4001234" gives "7314001234" and "20 30 40 50 60" nothing.
+    """
+    pieces = [''.join(filter(str.isdigit, piece)) for piece in run.split()]
+    for start, first in enumerate(pieces):
+        is_pincode = len(first) == 6 and not first.startswith('0')
+        digits = ''
+        found = None
+        for piece in pieces[start:]:
+            if len(piece) < 3 and not (piece == '91' and not digits):
+                break
+            if digits and is_pincode:
+                break
+            digits += piece
+            if len(digits) > 12:
+                break
+            found = _national_number(digits) or found
+        if found:
+            return found
+    return None
+
+
+def _trie_pattern(keywords):
+    """Build a regex alternation shaped like a trie so matching cost depends on
+    keyword length, not on how many keywords there are"""
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = True
+    return _node_pattern(trie)
+
+
+def _node_pattern(node):
+    branches = [re.escape(char) + _node_pattern(child)
+                for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ''
+
+    pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    if '' in node:
+        # Greedy optional group, so the longest keyword at a position wins
+        pattern = '(?:' + pattern + ')?'
+    return pattern
+
+
+class FieldClassifier:
+    """Score text nodes as name / phone / address in a single regex pass each.
+
+    keywords maps a field ('name' or 'address') to the words that hint at it,
+    e.g. {'name': ['hotel', 'cafe'], 'address': ['road', 'nagar', 'indore']}.
+    Keywords match as case-insensitive substrings, like the old `in text.lower()`
+    checks. min_length maps a field to the shortest text accepted for it.
+    """
+
+    def __init__(self, keywords, min_length=None):
+        self.min_length = dict(min_length or {})
+        self._fields_by_keyword = {}
+        for field, words in keywords.items():
+            if field not in KEYWORD_FIELDS:
+                raise ValueError(f"Unknown keyword field '{field}', expected one of {KEYWORD_FIELDS}")
+            for word in words:
+                word = word.strip().lower()
+                if word:
+                    self._fields_by_keyword.setdefault(word, set()).add(field)
+
+        alternatives = [f'(?P<phone>{PHONE_PATTERN})']
+        if self._fields_by_keyword:
+            alternatives.append(f'(?P<keyword>{_trie_pattern(self._fields_by_keyword)})')
+        self._pattern = re.compile('|'.join(alternatives))
+
+    def score(self, text):
+        """Return ({field: confidence}, phone or None) for a single text node.
+
+        The phone is the 10 digit national number, without +91 or a leading 0.
+        """
+        scores = dict.fromkeys(FIELDS, 0.0)
+        text = text.strip()
+        if not text:
+            return scores, None
+
+        phone = None
+        hits = {field: set() for field in KEYWORD_FIELDS}
+        for match in self._pattern.finditer(text.lower()):
+            if match.lastgroup == 'phone':
+                if phone is None:
+                    phone = _phone_digits(match.group())
+            else:
+                keyword = match.group()
+                for field in self._fields_by_keyword[keyword]:
+                    hits[field].add(keyword)
+
+        # Share of the node taken up by the number itself
+        phone_share = min(1.0, len(phone) / len(text)) if phone else 0.0
+        if phone:
+            # Any valid number passes, bare numbers rank above labelled ones like "Call 0987..."
+            scores['phone'] = 0.75 + 0.25 * phone_share
+        if hits['address']:
+            scores['address'] = 1.0 - 0.5 ** len(hits['address'])
+            if phone_share > 0.5:
+                # Mostly a number, the keywords are likely part of a label
+                scores['address'] /= 2
+        if not phone:
+            if hits['name']:
+                scores['name'] = 0.9
+            elif len(text.split()) >= 2:
+                scores['name'] = 0.5
+
+        for field, length in self.min_length.items():
+            if len(text) <= length:
+                scores[field] = 0.0
+
+        return scores, phone
+
+    def classify(self, texts, fields=FIELDS, min_confidence=0.5, trusted=None):
+        """Score every text node once and return {field: Candidate or None}.
+
+        The highest confidence wins; ties go to the earliest node, so callers
+        can pass nodes in order of preference. trusted maps a field to texts
+        from elements known to hold it (e.g. a dedicated address div); these
+        are checked first, score 1.0 without needing a keyword and are only
+        candidates for that field.
+        """
+        best = dict.fromkeys(fields)
+        nodes = [(text, field) for field, field_texts in (trusted or {}).items()
+                 if field in best for text in field_texts]
+        nodes += [(text, None) for text in texts]
+        for text, trusted_field in nodes:
+            if not text or not text.strip():
+                continue
+            scores, phone = self.score(text)
+            if trusted_field and (trusted_field != 'phone' or phone):
+                length = self.min_length.get(trusted_field, 0)
+                if len(text.strip()) > length:
+                    scores[trusted_field] = 1.0
+            for field in ((trusted_field,) if trusted_field else fields):
+                confidence = scores[field]
+                if confidence < min_confidence:
+                    continue
+                if best[field] is None or confidence > best[field].confidence:
+                    value = phone if field == 'phone' else text.strip()
+                    best[field] = Candidate(text.strip(), value, confidence)
+        return best
+
+
+def benchmark(node_count=2000, keyword_counts=(10, 100, 1000), repeat=5):
+    """Time classify() on synthetic nodes while the locality list grows"""
+    import random
+    import string
+    import timeit
+
+    rng = random.Random(0)
+
+    def word():
+        return ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 10)))
+
+    nodes = []
+    for _ in range(node_count):
+        kind = rng.randrange(3)
+        if kind == 0:
+            nodes.append(f"0{rng.randint(10**9, 10**10 - 1)}")
+        elif kind == 1:
+            nodes.append(f"{rng.randint(1, 200)}, {word().title()} Road, {word().title()} Nagar")
+        else:
+            nodes.append(f"{word().title()} {word().title()} Hotel")
+
+    for count in keyword_counts:
+        localities = ['road', 'nagar', 'street'] + [word() for _ in range(count)]
+        classifier = FieldClassifier({'name': ['hotel', 'cafe'], 'address': localities})
+        seconds = min(timeit.repeat(lambda: classifier.classify(nodes), number=1, repeat=repeat))
+        print(f"{count:>6} keywords: {seconds * 1000:8.2f} ms for {node_count} nodes")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -6,7 +6,19 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from time import sleep
-import re
+from field_classifier import FieldClassifier
+
+DEFAULT_KEYWORDS = {
+    'name': ['hotel', 'shop', 'bar', 'grill', 'food', 'kitchen'],
+    'address': ['road', 'area', 'street', 'nagar', 'chowk', 'square', 'amravati', 'indore']
+}
+
+def build_classifier(config):
+    """Compile the default keywords plus any extra ones listed under 'keywords' in config.yml"""
+    keywords = {field: list(words) for field, words in DEFAULT_KEYWORDS.items()}
+    for field, words in (config.get('keywords') or {}).items():
+        keywords.setdefault(field, []).extend(words)
+    return FieldClassifier(keywords, min_length={'name': 3, 'address': 10})
 
 def init_driver(headless=False):
     chrome_options = Options()
@@ -20,7 +32,7 @@ def init_driver(headless=False):
     driver.implicitly_wait(10)
     return driver
 
-def extract_all_business_data_at_once(driver):
+def extract_all_business_data_at_once(driver, classifier):
     """Extract all business data in one pass without re-finding elements"""
     
     print("🔍 EXTRACTING ALL BUSINESS DATA IN ONE PASS...")
@@ -46,7 +58,7 @@ def extract_all_business_data_at_once(driver):
             
             try:
                 # Extract all data from this container immediately
-                business_info = extract_single_business_complete(driver, container, i)
+                business_info = extract_single_business_complete(driver, container, i, classifier)
                 
                 if business_info and business_info.get('name'):
                     business_data.append(business_info)
@@ -67,7 +79,7 @@ def extract_all_business_data_at_once(driver):
     
     return business_data
 
-def extract_single_business_complete(driver, container, index):
+def extract_single_business_complete(driver, container, index, classifier):
     """Extract complete business info from a single container"""
     
     business_info = {
@@ -77,93 +89,32 @@ def extract_single_business_complete(driver, container, index):
     }
     
     try:
-        # Get container ID for specific XPath construction
-        container_id = container.get_attribute('id')
-        
-        # Extract name - look for H3 within this container
+        # Extract name - classify the H3s within this container
+        h3_texts = []
         try:
-            h3_elements = container.find_elements(By.XPATH, ".//h3")
-            for h3 in h3_elements:
-                text = h3.text.strip()
-                if text and len(text) > 3:
-                    # Check if it looks like a business name
-                    business_keywords = ['hotel', 'shop', 'bar', 'grill', 'food', 'kitchen']
-                    text_lower = text.lower()
-                    if (any(keyword in text_lower for keyword in business_keywords) or 
-                        len(text.split()) >= 2):
-                        business_info['name'] = text
-                        break
+            h3_texts = [h3.text for h3 in container.find_elements(By.XPATH, ".//h3")]
+            best = classifier.classify(h3_texts, fields=('name',))
+            if best['name']:
+                business_info['name'] = best['name'].value
         except Exception as e:
             print(f"   ⚠️ Name extraction error: {e}")
         
-        # Extract contact - try multiple methods within this container
-        try:
-            # Method 1: callcontent class
-            callcontent_elements = container.find_elements(By.XPATH, ".//span[contains(@class, 'callcontent')]")
-            for el in callcontent_elements:
-                text = el.text.strip()
-                phone_match = re.search(r'(\d{10,11})', text)
-                if phone_match:
-                    business_info['contact'] = phone_match.group(1)
-                    break
-            
-            # Method 2: If no callcontent found, try other patterns
-            if business_info['contact'] == "Not found":
-                phone_patterns = [
-                    ".//span[contains(text(), '08')]",  # Numbers starting with 08
-                    ".//span[contains(text(), '9')]",
-                    ".//span[contains(text(), '8')]", 
-                    ".//span[contains(text(), '7')]",
-                ]
-                
-                for pattern in phone_patterns:
-                    elements = container.find_elements(By.XPATH, pattern)
-                    for el in elements:
-                        text = el.text.strip()
-                        phone_match = re.search(r'(\d{10,11})', text)
-                        if phone_match:
-                            business_info['contact'] = phone_match.group(1)
-                            break
-                    if business_info['contact'] != "Not found":
-                        break
-                        
-        except Exception as e:
-            print(f"   ⚠️ Contact extraction error: {e}")
-        
-        # Extract address - try multiple methods within this container
+        # Extract contact and address - callcontent/locatcity are trusted first, then every
+        # other container line is scored in the same pass (skipping the name headings)
         try:
-            # Method 1: locatcity class (this was working)
-            locatcity_elements = container.find_elements(By.XPATH, ".//div[contains(@class, 'locatcity')]")
-            for el in locatcity_elements:
-                text = el.text.strip()
-                if text and len(text) > 10:
-                    business_info['address'] = text
-                    break
-            
-            # Method 2: If no locatcity found, try other patterns
-            if business_info['address'] == "Not found":
-                address_patterns = [
-                    ".//*[contains(text(), 'Indore')]",
-                    ".//*[contains(text(), 'Road')]",
-                    ".//*[contains(text(), 'Area')]",
-                    ".//*[contains(text(), 'Nagar')]",
-                ]
-                
-                for pattern in address_patterns:
-                    elements = container.find_elements(By.XPATH, pattern)
-                    for el in elements:
-                        text = el.text.strip()
-                        if text and len(text) > 10:
-                            # Check if it contains location keywords
-                            location_keywords = ['road', 'area', 'street', 'nagar', 'chowk', 'square', 'amravati']
-                            if any(keyword in text.lower() for keyword in location_keywords):
-                                business_info['address'] = text
-                                break
-                    if business_info['address'] != "Not found":
-                        break
-                        
+            trusted = {
+                'phone': [el.text for el in container.find_elements(By.XPATH, ".//span[contains(@class, 'callcontent')]")],
+                'address': [el.text for el in container.find_elements(By.XPATH, ".//div[contains(@class, 'locatcity')]")]
+            }
+            headings = {line.strip() for text in h3_texts for line in text.splitlines()}
+            lines = [line for line in container.text.splitlines() if line.strip() not in headings]
+            best = classifier.classify(lines, fields=('phone', 'address'), trusted=trusted)
+            if best['phone']:
+                business_info['contact'] = best['phone'].value
+            if best['address']:
+                business_info['address'] = best['address'].value
         except Exception as e:
-            print(f"   ⚠️ Address extraction error: {e}")
+            print(f"   ⚠️ Contact/address extraction error: {e}")
         
     except Exception as e:
         print(f"   ❌ Complete extraction error for container {index}: {e}")
@@ -193,6 +144,7 @@ def main():
     with open("/home/janhavi/Dora_world/Scraper/XPath-Scraper/config.yml", "r") as f:
         config = yaml.safe_load(f)
     
+    classifier = build_classifier(config)
     driver = init_driver(headless=False)
     
     try:
@@ -226,7 +178,7 @@ def main():
             return
         
         # Extract all business data in one pass
-        business_data = extract_all_business_data_at_once(driver)
+        business_data = extract_all_business_data_at_once(driver, classifier)
         
         print(f"\n📊 FINAL RESULTS:")
         print(f"Total businesses extracted: {len(business_data)}")
@@ -0,0 +1,113 @@
+from field_classifier import FieldClassifier
+
+KEYWORDS = {
+    'name': ['hotel', 'shop', 'bar', 'grill', 'food', 'kitchen'],
+    'address': ['road', 'area', 'street', 'nagar', 'chowk', 'square', 'amravati', 'indore', 'vijay nagar']
+}
+
+classifier = FieldClassifier(KEYWORDS, min_length={'name': 3, 'address': 10})
+
+
+def test_separate_fields_in_one_batch():
+    best = classifier.classify(['Hotel Shreemaya', '0731 4001234', '12, AB Road, Vijaynagar, Indore'])
+    assert best['name'].value == 'Hotel Shreemaya'
+    assert best['phone'].value == '7314001234'
+    assert best['address'].value == '12, AB Road, Vijaynagar, Indore'
+
+
+def test_tie_goes_to_earliest_node():
+    best = classifier.classify(['MG Road, Indore', 'AB Road, Indore'], fields=('address',))
+    assert best['address'].text == 'MG Road, Indore'
+
+
+def test_trusted_text_wins_without_keywords():
+    lines = ['Apna Sweets Vijay Nagar Indore', '4.1 2345 Ratings', 'Sector C, Vijay Nagar, Indore']
+    best = classifier.classify(lines, fields=('phone', 'address'), trusted={'address': ['Sector 5, Noida']})
+    assert best['address'].text == 'Sector 5, Noida'
+
+
+def test_trusted_phone_needs_a_number():
+    best = classifier.classify(['09876543210'], fields=('phone',), trusted={'phone': ['Call now']})
+    assert best['phone'].value == '9876543210'
+
+
+def test_trusted_text_only_counts_for_its_field():
+    best = classifier.classify([], fields=('phone', 'address'), trusted={'address': ['Shop 5, MG Road 0731 4001234']})
+    assert best['address'].text == 'Shop 5, MG Road 0731 4001234'
+    assert best['phone'] is None
+
+
+def test_two_numbers_gives_the_first():
+    scores, phone = classifier.score('9876543210 9876543211')
+    assert phone == '9876543210'
+    assert scores['phone'] >= 0.5
+
+
+def test_parenthesised_numbers():
+    assert classifier.score('(0731) 400-1234')[1] == '7314001234'
+
+
+def test_phone_format_is_national():
+    for text in ['+91 98765 43210', '098765 43210', '9876543210', '919876543210']:
+        assert classifier.score(text)[1] == '9876543210'
+
+
+def test_pincode_before_number_is_skipped():
+    assert classifier.score('Indore 452001 09876543210')[1] == '9876543210'
+
+
+def test_pincode_before_landline():
+    scores, phone = classifier.score('Indore 452001 0731 4001234')
+    assert phone == '7314001234'
+    assert scores['address'] >= 0.5
+
+
+def test_short_number_groups_are_not_phones():
+    scores, phone = classifier.score('20 30 40 50 60 Road Indore')
+    assert phone is None
+    assert scores['address'] >= 0.5
+
+
+def test_address_with_phone_keeps_address():
+    classifier = FieldClassifier({'address': ['road', 'indore', 'floor', 'opposite', 'temple']})
+    for line in ['12 AB Road, Indore, 0731 4001234', 'Shop 12, 3rd Floor, Opposite Temple, 098765 43210']:
+        best = classifier.classify([line], fields=('phone', 'address'))
+        assert best['address'].text == line
+
+
+def test_number_with_label_is_not_an_address():
+    scores, phone = classifier.score('Road 09876543210')
+    assert scores['address'] < 0.5
+
+
+def test_labelled_number_passes_threshold():
+    best = classifier.classify(['Call 09876543210 now please thanks'], fields=('phone',))
+    assert best['phone'].value == '9876543210'
+
+
+def test_short_digit_runs_are_not_phones():
+    scores, phone = classifier.score('4.1 2345 Ratings')
+    assert phone is None
+    assert scores['phone'] == 0.0
+
+
+def test_names_with_address_keywords_are_kept():
+    for name in ['Indore Chaat Center', 'Square Meal Corner', 'Hotel Indore Palace']:
+        best = classifier.classify([name], fields=('name',))
+        assert best['name'].value == name
+
+
+def test_name_keyword_beats_plain_words():
+    best = classifier.classify(['Open Now', 'Sayaji Grill'], fields=('name',))
+    assert best['name'].value == 'Sayaji Grill'
+
+
+def test_min_length_rejects_short_text():
+    best = classifier.classify(['Bar'], fields=('name',))
+    assert best['name'] is None
+
+
+def test_longest_keyword_wins():
+    # 'vijay nagar' is one hit; matching 'vijay' then 'nagar' would be two
+    classifier = FieldClassifier({'address': ['vijay', 'nagar', 'vijay nagar']})
+    assert classifier.score('Vijay Nagar')[0]['address'] == 0.5